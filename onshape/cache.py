@@ -0,0 +1,77 @@
+"""Persistent on-disk response cache.
+
+sqlite-backed key/value store used to keep API responses for immutable
+(version/microversion) contexts across tool invocations. Version content
+never changes, so re-running an export against the same version can skip
+the entire metadata phase.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "onshape-export" / "cache.db"
+
+
+def cache_key(*parts: str) -> str:
+    """Stable key for a response: sha256 over the identifying strings."""
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class PersistentCache:
+    """JSON key/value cache backed by sqlite.
+
+    Values must be JSON-serializable. Entries with a TTL expire lazily on
+    read; entries stored without a TTL live forever (immutable contexts).
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared across the fetch thread pool; guard with a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v BLOB, expires REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT v, expires FROM kv WHERE k = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires = row
+        if expires is not None and expires < time.time():
+            with self._lock:
+                self._conn.execute("DELETE FROM kv WHERE k = ?", (key,))
+                self._conn.commit()
+            return None
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            blob = json.dumps(value)
+        except (TypeError, ValueError):
+            logging.debug(f"Skipping non-JSON-serializable cache value for {key}")
+            return
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (k, v, expires) VALUES (?, ?, ?)",
+                (key, blob, expires)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
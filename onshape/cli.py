@@ -23,7 +23,8 @@ def get_run_command() -> str:
     return "python onshape_export_tool.py"
 
 
-def run_main_menu(secrets_path: Path, config_path: Path, output_path: Path) -> None:
+def run_main_menu(secrets_path: Path, config_path: Path, output_path: Path,
+                  max_parallel: int = 4, use_disk_cache: bool = True) -> None:
     """Main interactive menu loop."""
     print_header("ONSHAPE EXPORT TOOL")
     
@@ -52,8 +53,10 @@ def run_main_menu(secrets_path: Path, config_path: Path, output_path: Path) -> N
     
     # Export document flow (choice == 0)
     secrets = get_or_prompt_secrets(secrets_path)
-    client = OnshapeClient(secrets['access_key'], secrets['secret_key'])
-    
+    client = OnshapeClient(secrets['access_key'], secrets['secret_key'],
+                           max_parallel=max_parallel,
+                           use_disk_cache=use_disk_cache)
+
     run_interactive_export(client, output_path)
 
 
@@ -71,6 +74,10 @@ def main():
                         help="Delete existing DXFs/PDFs before export")
     parser.add_argument("--clean-after", action="store_true",
                         help="Delete DXFs/PDFs from document after packaging")
+    parser.add_argument("--max-parallel", type=int, default=4,
+                        help="Max concurrent translations/downloads (default: 4)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk response cache")
     
     # Non-interactive mode flags
     parser.add_argument("--doc-id", help="Document ID for non-interactive export")
@@ -106,8 +113,10 @@ def main():
             return
         
         secrets = get_or_prompt_secrets(secrets_path)
-        client = OnshapeClient(secrets['access_key'], secrets['secret_key'])
-        
+        client = OnshapeClient(secrets['access_key'], secrets['secret_key'],
+                               max_parallel=args.max_parallel,
+                               use_disk_cache=not args.no_cache)
+
         if args.version_id:
             ctx = make_version_context(args.doc_id, args.version_id)
             logging.info(f"Exporting from version: {args.version_id}")
@@ -123,7 +132,9 @@ def main():
         return
     
     # Default: interactive mode
-    run_main_menu(secrets_path, config_path, output_path)
+    run_main_menu(secrets_path, config_path, output_path,
+                  max_parallel=args.max_parallel,
+                  use_disk_cache=not args.no_cache)
 
 
 if __name__ == "__main__":
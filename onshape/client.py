@@ -2,10 +2,23 @@
 
 HTTP transport and all API operations for interacting with Onshape.
 """
-import json
+import functools
 import logging
+import os
+import random
+import sys
+import threading
 import time
-import requests
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson  # 2-5x faster JSON than stdlib; optional
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from .cache import PersistentCache, cache_key
 from typing import Dict, Any, List, Optional, Tuple, Callable, TypeVar, cast
 from typing_extensions import TypedDict
 
@@ -18,10 +31,26 @@ API_BASE = "https://cad.onshape.com/api/v12"
 DEFAULT_TEMPLATE_DOC = "09fb14dcb55eee217f55fa7b"
 DEFAULT_TEMPLATE_ELEMENT = "149ce62208ba05ac0cee75e5"
 
-# Onshape property IDs for metadata lookup
-PROP_PART_NUMBER = "57f3fb8efa3416c06701d60f"
-PROP_REVISION = "57f3fb8efa3416c06701d610"
-PROP_MATERIAL = "57f3fb8efa3416c06701d615"
+# Onshape property IDs for metadata lookup (interned: compared against
+# every property ID in every metadata response)
+PROP_PART_NUMBER = sys.intern("57f3fb8efa3416c06701d60f")
+PROP_REVISION = sys.intern("57f3fb8efa3416c06701d610")
+PROP_MATERIAL = sys.intern("57f3fb8efa3416c06701d615")
+
+# Endpoint templates for the hottest calls (per-part and poll loops);
+# %-format on a precomputed template beats rebuilding the f-string parts
+_ENDPOINT_ELEMENTS = "/documents%s/elements"
+_ENDPOINT_PART_METADATA = "/metadata%s/e/%s/p/%s"
+_ENDPOINT_ELEMENT_PART_METADATA = "/metadata%s/e/%s/p"
+_ENDPOINT_PART_BBOX = "/parts%s/e/%s/partid/%s/boundingboxes"
+
+# Transient statuses worth retrying: Onshape's rate limiter (429) and
+# gateway hiccups. 429 means the request was never processed, so it is
+# safe to retry any method; the 5xx set is only retried for GETs, where
+# a duplicate send cannot double-apply a mutation.
+_RETRY_STATUS_ALL = frozenset({429})
+_RETRY_STATUS_GET = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 4
 
 # Type alias for export results: (element_id, filename)
 ExportResult = Tuple[str, str]
@@ -38,8 +67,18 @@ class DocContext(TypedDict):
     wvm_id: str
 
 
+# doc_path runs on every API call; the /d/{did}/{wvm}/{id} prefix is
+# identical across a whole export, so build it once per context
+_doc_path_prefixes: Dict[Tuple[str, str, str], str] = {}
+
+
 def doc_path(ctx: DocContext, suffix: str = "") -> str:
-    return f"/d/{ctx['did']}/{ctx['wvm_type']}/{ctx['wvm_id']}{suffix}"
+    key = (ctx['did'], ctx['wvm_type'], ctx['wvm_id'])
+    prefix = _doc_path_prefixes.get(key)
+    if prefix is None:
+        prefix = f"/d/{key[0]}/{key[1]}/{key[2]}"
+        _doc_path_prefixes[key] = prefix
+    return prefix + suffix
 
 
 def is_mutable(ctx: DocContext) -> bool:
@@ -60,18 +99,25 @@ def poll_until(
     fetch: Callable[[], Any],
     predicate: Callable[[Any], Optional[T]],
     timeout: int = 60,
-    interval: float = 2.0
+    initial_interval: float = 0.25,
+    max_interval: float = 5.0
 ) -> Optional[T]:
-    """Poll until predicate returns non-None."""
-    import time
+    """Poll until predicate returns non-None.
+
+    Sleeps with exponential backoff (doubling from initial_interval up to
+    max_interval) plus +/-20% jitter: quick jobs get fast first polls,
+    slow ones stop hammering the API at a fixed rate.
+    """
     start = time.time()
+    delay = initial_interval
     while time.time() - start < timeout:
         result = fetch()
         if result is not None:
             match = predicate(result)
             if match is not None:
                 return match
-        time.sleep(interval)
+        time.sleep(delay * (0.8 + 0.4 * random.random()))
+        delay = min(delay * 2, max_interval)
     logging.warning(f"Poll timed out after {timeout}s")
     return None
 
@@ -80,26 +126,85 @@ def poll_until(
 
 class OnshapeClient:
     """HTTP transport only. Business logic is in standalone functions that accept client.
-    
+
     Uses HTTP Basic auth with Onshape API keys (not OAuth).
     Returns parsed JSON or raw bytes depending on Content-Type.
+
+    The transport is a single httpx.Client with HTTP/2 enabled so the
+    many small REST calls an export makes multiplex over one pooled TLS
+    connection instead of paying handshake/RTT costs per call.
     """
-    
-    def __init__(self, access_key: str, secret_key: str, base_url: str = API_BASE):
+
+    def __init__(self, access_key: str, secret_key: str, base_url: str = API_BASE,
+                 max_parallel: int = 4, use_disk_cache: bool = True):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.auth = (access_key, secret_key)
-        self.session.headers.update({
-            'Accept': 'application/vnd.onshape.v1+json',
-            'Content-Type': 'application/json'
-        })
+        self.max_workers = 8  # Fan-out width for batched fetches
+        # Back-pressure for export-heavy operations (translations, blob
+        # downloads): caps in-flight jobs independent of any pool size
+        self._export_sem = threading.BoundedSemaphore(max_parallel)
+        self._cache: Dict[Tuple[str, str, str, str], Any] = {}
+        # Guards _cache/_etags/_etag_bodies: cached_get inserts and
+        # invalidate() iterates from concurrent worker threads, same
+        # sharing PersistentCache already locks against
+        self._cache_lock = threading.Lock()
+        # ETag -> body store for conditional GETs (If-None-Match / 304),
+        # keyed by (endpoint, sorted query params); JSON responses only
+        self._etags: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], str] = {}
+        self._etag_bodies: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = {}
+        self._disk_cache: Optional[PersistentCache] = None
+        if use_disk_cache:
+            try:
+                self._disk_cache = PersistentCache()
+            except Exception as e:
+                logging.debug(f"Persistent cache unavailable: {e}")
+        self.session = httpx.Client(
+            http2=True,
+            base_url=base_url,
+            auth=(access_key, secret_key),
+            headers={
+                # Content-Type is set per request when a body is sent;
+                # GETs and DELETEs carry none
+                'Accept': 'application/vnd.onshape.v1+json',
+                # Metadata-heavy JSON compresses 5-10x; be explicit so
+                # custom header updates can never drop it. br needs the
+                # optional brotli package, else the server picks gzip.
+                'Accept-Encoding': 'gzip, deflate, br'
+            },
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        )
 
     def request(self, method: str, endpoint: str, **kwargs) -> Any:
         """404 on /translations often means missing export rule in Onshape."""
-        url = endpoint if endpoint.startswith('http') else f"{self.base_url}{endpoint}"
         try:
-            logging.debug(f"API Request: {method} {url}")
-            response = self.session.request(method, url, **kwargs)
+            logging.debug(f"API Request: {method} {endpoint}")
+            if orjson is not None and 'json' in kwargs:
+                # Pre-serialize with orjson; raw content needs the
+                # Content-Type that httpx would set for json=
+                kwargs['content'] = orjson.dumps(kwargs.pop('json'))
+                headers = dict(kwargs.get('headers') or {})
+                headers.setdefault('Content-Type', 'application/json')
+                kwargs['headers'] = headers
+            # Keyed by endpoint AND query params: list_elements and the
+            # elementId-filtered get_element share an endpoint string but
+            # are different representations, and must never swap bodies
+            etag_key: Optional[Tuple[str, Tuple[Tuple[str, Any], ...]]] = None
+            if method == 'GET':
+                etag_key = (endpoint, tuple(sorted((kwargs.get('params') or {}).items())))
+                with self._cache_lock:
+                    etag = self._etags.get(etag_key)
+                if etag is not None:
+                    # Replay the stored ETag; a 304 means no body on the wire
+                    headers = dict(kwargs.get('headers') or {})
+                    headers['If-None-Match'] = etag
+                    kwargs['headers'] = headers
+            response = self._send_with_retry(method, endpoint, **kwargs)
+            if response.status_code == 304:
+                with self._cache_lock:
+                    body = self._etag_bodies.get(etag_key)
+                if body is not None:
+                    logging.debug(f"304 Not Modified: {endpoint}")
+                    return body
             if response.status_code >= 400:
                 logging.error(f"Error {response.status_code}: {response.text}")
                 # Provide helpful hint for 404 errors on translation endpoints
@@ -113,21 +218,133 @@ class OnshapeClient:
             
             content_type = response.headers.get('Content-Type', '')
             if 'application/json' in content_type:
-                return response.json()
-            return response.content
-        except requests.RequestException as e:
+                if orjson is not None:
+                    parsed: Any = orjson.loads(response.content)
+                else:
+                    parsed = response.json()
+            else:
+                parsed = response.content
+
+            # Only JSON responses are worth pinning in memory; blob GETs
+            # would park whole DXF/PDF payloads here indefinitely
+            if etag_key is not None and 'application/json' in content_type:
+                etag = response.headers.get('ETag')
+                if etag:
+                    with self._cache_lock:
+                        self._etags[etag_key] = etag
+                        self._etag_bodies[etag_key] = parsed
+            return parsed
+        except httpx.HTTPError as e:
             logging.error(f"API request failed: {e}")
             raise
 
+    def _send_with_retry(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send, retrying transient statuses with exponential backoff.
+
+        Honors Retry-After when the rate limiter sends one; otherwise
+        backs off 0.2s doubling per attempt, capped at _MAX_RETRIES.
+        """
+        retryable = _RETRY_STATUS_GET if method == 'GET' else _RETRY_STATUS_ALL
+        delay = 0.2
+        for attempt in range(_MAX_RETRIES):
+            response = self.session.request(method, endpoint, **kwargs)
+            if response.status_code not in retryable:
+                return response
+            retry_after = response.headers.get('Retry-After')
+            wait = float(retry_after) if retry_after and retry_after.isdigit() else delay
+            logging.warning(
+                f"Got {response.status_code} on {method} {endpoint}; "
+                f"retrying in {wait:.1f}s ({attempt + 1}/{_MAX_RETRIES})"
+            )
+            time.sleep(wait)
+            delay = min(delay * 2, 5.0)
+        return self.session.request(method, endpoint, **kwargs)
+
+    def export_slot(self) -> threading.BoundedSemaphore:
+        """Acquire a bounded slot for a heavy export operation.
+
+        Usage: ``with client.export_slot(): ...`` — limits concurrent
+        translations/downloads to avoid Onshape 429s and keep in-flight
+        blobs from spiking memory.
+        """
+        return self._export_sem
+
+    def cached_get(self, ctx: DocContext, endpoint: str, mv: Optional[str] = None) -> Any:
+        """GET with an in-process cache keyed by document context + endpoint.
+
+        Metadata is re-fetched many times per export (filename assembly,
+        microversion checks); caching eliminates the redundant round-trips.
+        Mutating operations call invalidate() to keep cached data honest.
+
+        Args:
+            mv: Element microversion. When given, responses from mutable
+                contexts also persist to the on-disk cache keyed by the
+                microversion — safe because the data only changes when
+                the microversion does.
+        """
+        key = (ctx['did'], ctx['wvm_type'], ctx['wvm_id'], endpoint)
+        with self._cache_lock:
+            if key in self._cache:
+                logging.debug(f"Cache hit: {endpoint}")
+                return self._cache[key]
+
+        # Immutable contexts always hit the on-disk cache, which survives
+        # across tool invocations (version content never changes); mutable
+        # contexts do too when the caller supplies a microversion to key by
+        persistable = self._disk_cache is not None and (not is_mutable(ctx) or mv is not None)
+        disk_key = cache_key(*key) if mv is None else cache_key(*key, mv)
+        if persistable:
+            hit = self._disk_cache.get(disk_key)
+            if hit is not None:
+                logging.debug(f"Disk cache hit: {endpoint}")
+                with self._cache_lock:
+                    self._cache[key] = hit
+                return hit
+
+        result = self.request('GET', endpoint)
+        with self._cache_lock:
+            self._cache[key] = result
+        if persistable and isinstance(result, (dict, list)):
+            self._disk_cache.put(disk_key, result)
+        return result
+
+    def invalidate(self, ctx: DocContext, prefix: Optional[str] = None) -> None:
+        """Drop cached GETs for a context (optionally only endpoints under prefix).
+
+        No-op for immutable contexts: version/microversion responses never change.
+        """
+        if not is_mutable(ctx):
+            return
+        ctx_key = (ctx['did'], ctx['wvm_type'], ctx['wvm_id'])
+        with self._cache_lock:
+            stale = [
+                k for k in self._cache
+                if k[:3] == ctx_key and (prefix is None or k[3].startswith(prefix))
+            ]
+            for k in stale:
+                del self._cache[k]
+
 
 # --- API Operations ---
 
 def list_elements(client: OnshapeClient, ctx: DocContext) -> List[Dict[str, Any]]:
-    endpoint = f"/documents{doc_path(ctx)}/elements"
-    resp = client.request('GET', endpoint)
+    # Safe to cache even for workspaces: every mutating call in this
+    # module (delete/create/rename/suppress/translate) invalidates the
+    # context, and the microversion poll bypasses the cache entirely.
+    endpoint = _ENDPOINT_ELEMENTS % doc_path(ctx)
+    resp = client.cached_get(ctx, endpoint)
     return resp if isinstance(resp, list) else resp.get('elements', [])
 
 
+def elements_by_id(client: OnshapeClient, ctx: DocContext) -> Dict[str, Dict[str, Any]]:
+    """Document elements indexed by id for O(1) lookup.
+
+    The dict build runs at C speed, replacing the Python-level linear
+    scans the poll loops used to do per lookup.
+    """
+    return {e['id']: e for e in list_elements(client, ctx)}
+
+
 def get_features(client: OnshapeClient, ctx: DocContext, eid: str) -> List[Dict[str, Any]]:
     endpoint = f"/partstudios{doc_path(ctx)}/e/{eid}/features"
     resp = client.request('GET', endpoint)
@@ -147,36 +364,136 @@ def list_parts(
 
 def categorize_parts(parts: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Separate flat patterns (export directly) from regular parts."""
-    flat_patterns = []
-    regular_parts = []
-    flat_part_originals = set()  # IDs of parts that have flat patterns
-    
-    for part in parts:
-        if part.get('isFlattenedBody'):
-            flat_patterns.append(part)
-            if part.get('unflattenedPartId'):
-                flat_part_originals.add(part['unflattenedPartId'])
-        else:
-            regular_parts.append(part)
-    
-    # Filter out original sheet metal parts (they have flat patterns)
-    regular_parts = [p for p in regular_parts if p.get('partId') not in flat_part_originals]
-    
+    # Originals that have a flat pattern are dropped from regular_parts.
+    flat_part_originals = {
+        p['unflattenedPartId'] for p in parts
+        if p.get('isFlattenedBody') and p.get('unflattenedPartId')
+    }
+    flat_patterns = [p for p in parts if p.get('isFlattenedBody')]
+    regular_parts = [
+        p for p in parts
+        if not p.get('isFlattenedBody') and p.get('partId') not in flat_part_originals
+    ]
     return flat_patterns, regular_parts
 
 
 def get_part_metadata(
-    client: OnshapeClient, ctx: DocContext, eid: str, part_id: str
+    client: OnshapeClient, ctx: DocContext, eid: str, part_id: str,
+    mv: Optional[str] = None
 ) -> Dict[str, Any]:
-    endpoint = f"/metadata{doc_path(ctx)}/e/{eid}/p/{part_id}"
-    return client.request('GET', endpoint)
+    endpoint = _ENDPOINT_PART_METADATA % (doc_path(ctx), eid, part_id)
+    return client.cached_get(ctx, endpoint, mv=mv)
 
 
 def get_part_bounding_box(
-    client: OnshapeClient, ctx: DocContext, eid: str, part_id: str
+    client: OnshapeClient, ctx: DocContext, eid: str, part_id: str,
+    mv: Optional[str] = None
 ) -> Dict[str, float]:
-    endpoint = f"/parts{doc_path(ctx)}/e/{eid}/partid/{part_id}/boundingboxes"
-    return client.request('GET', endpoint)
+    endpoint = _ENDPOINT_PART_BBOX % (doc_path(ctx), eid, part_id)
+    return client.cached_get(ctx, endpoint, mv=mv)
+
+
+def list_all_part_metadata(
+    client: OnshapeClient, ctx: DocContext, eid: str,
+    mv: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch metadata for every part of an element in one round trip.
+
+    The element-level metadata endpoint returns the same per-part shape
+    as get_part_metadata, collapsing N part requests into one.
+
+    Returns:
+        Dict mapping part_id -> metadata dict
+    """
+    endpoint = _ENDPOINT_ELEMENT_PART_METADATA % (doc_path(ctx), eid)
+    resp = client.cached_get(ctx, endpoint, mv=mv)
+    items = resp.get('items', []) if isinstance(resp, dict) else resp
+    return {item['partId']: item for item in items if item.get('partId')}
+
+
+class PartInfo(TypedDict, total=False):
+    """Prefetched per-part data from fetch_parts_info."""
+    metadata: Dict[str, Any]
+    bounding_box: Dict[str, float]
+
+
+def fetch_parts_info(
+    client: OnshapeClient,
+    ctx: DocContext,
+    eid: str,
+    part_ids: List[str],
+    max_workers: Optional[int] = None
+) -> Dict[str, PartInfo]:
+    """Fetch metadata and bounding boxes for many parts concurrently.
+
+    Each part needs two independent HTTP round-trips; fanning them out on
+    a thread pool turns N parts * 2 sequential calls into ~2N/workers
+    batches. Failed fetches are logged and omitted from the result.
+
+    Returns:
+        Dict mapping part_id -> PartInfo (keys absent on fetch failure)
+    """
+    if not part_ids:
+        return {}
+
+    workers = max_workers if max_workers is not None else client.max_workers
+    info: Dict[str, PartInfo] = {pid: PartInfo() for pid in part_ids}
+
+    # One microversion lookup per studio lets every per-part response
+    # persist in the disk cache, so unchanged studios skip all 2N
+    # fetches on the next run; amortized across the whole batch
+    mv: Optional[str] = None
+    if is_mutable(ctx):
+        try:
+            mv = get_element_microversion(client, ctx, eid)
+        except Exception as e:
+            logging.debug(f"Microversion lookup failed for {eid}: {e}")
+
+    def fetch(job):
+        pid, key, fn = job
+        return pid, key, fn(client, ctx, eid, pid, mv=mv)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # One bulk call covers metadata for all parts; it overlaps with
+        # the per-part bounding-box fan-out
+        meta_future = executor.submit(list_all_part_metadata, client, ctx, eid, mv)
+        futures = [
+            executor.submit(fetch, (pid, 'bounding_box', get_part_bounding_box))
+            for pid in part_ids
+        ]
+
+        try:
+            bulk_meta = meta_future.result()
+        except Exception as e:
+            logging.debug(f"Bulk metadata fetch failed: {e}")
+            bulk_meta = {}
+
+        for pid in part_ids:
+            meta = bulk_meta.get(pid)
+            if meta is not None:
+                info[pid]['metadata'] = meta
+            else:
+                # Per-part fallback for anything the bulk endpoint missed
+                futures.append(executor.submit(fetch, (pid, 'metadata', get_part_metadata)))
+
+        for future in futures:
+            try:
+                pid, key, result = future.result()
+                info[pid][key] = result  # type: ignore[literal-required]
+            except Exception as e:
+                logging.debug(f"Batch part fetch failed: {e}")
+
+    return info
+
+
+def thickness_from_bbox(bbox: Dict[str, float]) -> Optional[float]:
+    """Thickness in mm from bounding box Z-height. Assumes part is oriented face-normal parallel to z-axis."""
+    z_height = abs(bbox.get('highZ', 0) - bbox.get('lowZ', 0))
+    thickness_mm = z_height * 1000  # Bounding box is in meters
+
+    if thickness_mm > 0.01:
+        return thickness_mm
+    return None
 
 
 def get_part_thickness(
@@ -185,22 +502,28 @@ def get_part_thickness(
     """Returns thickness in mm from bounding box Z-height. Assumes part is oriented face-normal parallel to z-axis."""
     try:
         bbox = get_part_bounding_box(client, ctx, eid, part_id)
-        z_height = abs(bbox.get('highZ', 0) - bbox.get('lowZ', 0))
-        thickness_mm = z_height * 1000  # Bounding box is in meters
-        
-        if thickness_mm > 0.01:
-            return thickness_mm
+        return thickness_from_bbox(bbox)
     except Exception as e:
         logging.debug(f"Failed to get bounding box for part {part_id}: {e}")
-    
+
     return None
 
 
+@functools.lru_cache(maxsize=64)
 def format_thickness_prefix(thickness_mm: Optional[float]) -> str:
-    """Returns e.g. '3mm' for filenames. Empty string if None/invalid."""
+    """Returns e.g. '3mm' for filenames. Empty string if None/invalid.
+
+    Cached: a document usually has only a handful of distinct stock
+    thicknesses across all its parts.
+    """
     if thickness_mm is None or thickness_mm <= 0:
         return ""
-    
+
+    # Integral values (the common case: 3mm, 6mm stock) skip the
+    # format-then-strip dance entirely
+    if thickness_mm == int(thickness_mm):
+        return f"{int(thickness_mm)}mm"
+
     # Format to 1 decimal place, removing trailing zeros
     formatted = f"{thickness_mm:.1f}".rstrip('0').rstrip('.')
     return f"{formatted}mm"
@@ -213,29 +536,45 @@ class PartProperties(TypedDict, total=False):
     material: str
 
 
-def extract_properties_from_lookup(
-    prop_lookup: Dict[str, Any],
+def extract_properties_from_list(
+    properties: List[Dict[str, Any]],
     include_material: bool = True
 ) -> Tuple[PartProperties, List[str]]:
-    """Core extraction from property lookup dict. Returns (props, missing)."""
+    """Single-pass extraction from a metadata properties array.
+
+    Scans the list once dispatching on propertyId instead of building an
+    intermediate lookup dict of all 30-50 properties per part.
+
+    Returns (props, missing).
+    """
+    part_number: Any = None
+    revision: Any = None
+    material_val: Any = None
+
+    for p in properties:
+        pid = p.get('propertyId')
+        if pid == PROP_PART_NUMBER:
+            part_number = p.get('value', '')
+        elif pid == PROP_REVISION:
+            revision = p.get('value', '')
+        elif pid == PROP_MATERIAL:
+            material_val = p.get('value', '')
+
     props: PartProperties = {}
     missing: List[str] = []
-    
-    # Part Number
-    if PROP_PART_NUMBER in prop_lookup and prop_lookup[PROP_PART_NUMBER]:
-        props['part_number'] = str(prop_lookup[PROP_PART_NUMBER])
+
+    if part_number:
+        props['part_number'] = str(part_number)
     else:
         missing.append('Part Number')
-    
-    # Revision
-    if PROP_REVISION in prop_lookup and prop_lookup[PROP_REVISION]:
-        props['revision'] = str(prop_lookup[PROP_REVISION])
+
+    if revision:
+        props['revision'] = str(revision)
     else:
         missing.append('Revision')
-    
+
     # Material (optional, for parts only)
     if include_material:
-        material_val = prop_lookup.get(PROP_MATERIAL)
         if material_val:
             if isinstance(material_val, dict):
                 props['material'] = material_val.get('displayName', '')
@@ -245,22 +584,29 @@ def extract_properties_from_lookup(
                 missing.append('Material')
         else:
             missing.append('Material')
-    
+
     return props, missing
 
 
+def properties_from_metadata(
+    metadata: Dict[str, Any],
+    include_material: bool = True
+) -> Tuple[PartProperties, List[str]]:
+    """Extract properties from an already-fetched metadata response."""
+    return extract_properties_from_list(
+        metadata.get('properties', []), include_material=include_material
+    )
+
+
 def get_element_properties(
     client: OnshapeClient, ctx: DocContext, eid: str
 ) -> Tuple[PartProperties, List[str]]:
     """Fetch properties from element metadata (no material)."""
     try:
         endpoint = f"/metadata{doc_path(ctx)}/e/{eid}"
-        metadata = client.request('GET', endpoint)
-        properties = metadata.get('properties', [])
-        
-        prop_lookup = {p.get('propertyId'): p.get('value', '') for p in properties}
-        return extract_properties_from_lookup(prop_lookup, include_material=False)
-        
+        metadata = client.cached_get(ctx, endpoint)
+        return properties_from_metadata(metadata, include_material=False)
+
     except Exception as e:
         logging.warning(f"Failed to get properties for element {eid}: {e}")
         return {}, ['Part Number', 'Revision']
@@ -272,11 +618,8 @@ def get_part_properties(
     """Fetch properties from part metadata (includes material)."""
     try:
         metadata = get_part_metadata(client, ctx, eid, part_id)
-        properties = metadata.get('properties', [])
-        
-        prop_lookup = {p.get('propertyId'): p.get('value', '') for p in properties}
-        return extract_properties_from_lookup(prop_lookup, include_material=True)
-            
+        return properties_from_metadata(metadata, include_material=True)
+
     except Exception as e:
         logging.warning(f"Failed to get properties for part {part_id}: {e}")
         return {}, ['Part Number', 'Revision', 'Material']
@@ -301,20 +644,17 @@ def build_export_filename(
     material = props.get('material', '') if include_material else ''
     thickness_str = format_thickness_prefix(thickness_mm) if thickness_mm else ''
     
-    # Build filename if we have required properties
+    # Build filename if we have required properties; branch directly on
+    # the prefix combination instead of allocating a list to join
     if part_number and revision:
-        parts = []
+        core = f"{part_number}_Rev {revision}"
+
+        if thickness_str and material:
+            return f"{thickness_str} {material}_{core}.{extension}"
         if thickness_str:
-            parts.append(thickness_str)
+            return f"{thickness_str}_{core}.{extension}"
         if material:
-            parts.append(material)
-        
-        # Core: partNumber_Rev revision
-        core = f"{part_number}_Rev {revision}"
-        
-        if parts:
-            prefix = ' '.join(parts)
-            return f"{prefix}_{core}.{extension}"
+            return f"{material}_{core}.{extension}"
         return f"{core}.{extension}"
     
     # Fallback: use provided name with optional thickness prefix
@@ -361,9 +701,10 @@ def update_feature_suppression(
     suppressed: bool
 ) -> None:
     feature_id = feature.get('featureId')
-    feature_copy = json.loads(json.dumps(feature))
-    feature_copy['suppressed'] = suppressed
-    
+    # Only a top-level key changes; a shallow copy avoids the JSON
+    # round-trip deep copy that reparsed the whole feature tree
+    feature_copy = {**feature, 'suppressed': suppressed}
+
     payload = {
         "feature": feature_copy,
         "serializationVersion": "1.2.15",
@@ -371,35 +712,45 @@ def update_feature_suppression(
     }
     endpoint = f"/partstudios{doc_path(ctx)}/e/{eid}/features/featureid/{feature_id}"
     client.request('POST', endpoint, json=payload)
+    # Suppression changes geometry and bounding boxes — drop everything
+    client.invalidate(ctx)
 
 
 def delete_element(client: OnshapeClient, ctx: DocContext, eid: str) -> None:
     endpoint = f"/elements{doc_path(ctx)}/e/{eid}"
     logging.info(f"Deleting element {eid}")
     client.request('DELETE', endpoint)
+    client.invalidate(ctx)
+
+
+# The Name propertyId is schema-level, not per-element, so one lookup
+# serves every rename in the run.
+_NAME_PROP_ID: Optional[str] = None
 
 
 def rename_element(client: OnshapeClient, ctx: DocContext, eid: str, new_name: str) -> None:
     """Rename element to match assembled filename."""
+    global _NAME_PROP_ID
     endpoint = f"/metadata{doc_path(ctx)}/e/{eid}"
-    
+
     try:
-        # First, get the element's metadata to find the Name propertyId
-        metadata = client.request('GET', endpoint)
-        properties = metadata.get('properties', [])
-        
-        # Find the Name property
-        name_prop_id = None
-        for prop in properties:
-            if prop.get('name') == 'Name':
-                name_prop_id = prop.get('propertyId')
-                break
-        
-        if not name_prop_id:
-            logging.warning(f"Could not find Name propertyId for element {eid}")
-            logging.debug(f"Available properties: {[p.get('name') for p in properties]}")
-            return
-        
+        name_prop_id = _NAME_PROP_ID
+        if name_prop_id is None:
+            # Get the element's metadata to find the Name propertyId
+            metadata = client.request('GET', endpoint)
+            properties = metadata.get('properties', [])
+
+            for prop in properties:
+                if prop.get('name') == 'Name':
+                    name_prop_id = prop.get('propertyId')
+                    break
+
+            if not name_prop_id:
+                logging.warning(f"Could not find Name propertyId for element {eid}")
+                logging.debug(f"Available properties: {[p.get('name') for p in properties]}")
+                return
+            _NAME_PROP_ID = name_prop_id
+
         # Update the name
         payload = {
             "properties": [
@@ -408,8 +759,13 @@ def rename_element(client: OnshapeClient, ctx: DocContext, eid: str, new_name: s
         }
         logging.debug(f"Renaming element {eid} to '{new_name}' using propertyId {name_prop_id}")
         client.request('POST', endpoint, json=payload)
-        
+        # Names also appear in the cached element list, so drop the
+        # whole context rather than just the metadata endpoints
+        client.invalidate(ctx)
+
     except Exception as e:
+        # Drop the cached propertyId in case it was the stale part
+        _NAME_PROP_ID = None
         logging.warning(f"Failed to rename element {eid}: {e}")
 
 
@@ -450,6 +806,7 @@ def create_drawing(client: OnshapeClient, ctx: DocContext, name: str) -> str:
     }
     logging.info(f"Creating drawing '{name}'")
     resp = client.request('POST', endpoint, json=payload)
+    client.invalidate(ctx)
     return cast(str, resp.get('id'))
 
 
@@ -488,6 +845,7 @@ def add_view_to_drawing(
     }
     logging.info(f"Adding view of part {part_id} to drawing {drawing_eid}")
     client.request('POST', endpoint, json=payload)
+    client.invalidate(ctx)
 
 
 def initiate_translation(
@@ -513,15 +871,26 @@ def initiate_translation(
     
     logging.info(f"Initiating {format_name} translation for element {eid}")
     resp = client.request('POST', endpoint, json=payload)
+    # storeInDocument adds a blob element once the job lands
+    client.invalidate(ctx)
     return cast(str, resp.get('id'))
 
 
 def poll_translation(client: OnshapeClient, translation_id: str, timeout: int = 300) -> Optional[str]:
     """Poll until translation completes. Returns element_id or None."""
     endpoint = f"/translations/{translation_id}"
-    
+    longpoll_attempted = [False]
+
     def fetch() -> Optional[Dict[str, Any]]:
         try:
+            if not longpoll_attempted[0]:
+                longpoll_attempted[0] = True
+                # Ask the server to hold the first request until the job
+                # finishes where supported; unknown query params are
+                # ignored, so this degrades to a plain status GET
+                return client.request(
+                    'GET', endpoint, params={'waitFor': 'DONE', 'timeout': 20}
+                )
             return client.request('GET', endpoint)
         except Exception as e:
             logging.error(f"Failed to poll translation {translation_id}: {e}")
@@ -550,6 +919,34 @@ def poll_translation(client: OnshapeClient, translation_id: str, timeout: int =
     return result
 
 
+def poll_translations(
+    client: OnshapeClient,
+    translation_ids: List[str],
+    timeout: int = 300,
+    max_workers: Optional[int] = None
+) -> Dict[str, Optional[str]]:
+    """Poll many translations concurrently.
+
+    Onshape runs translation jobs in parallel server-side, so polling
+    serially makes total wall time the sum of job durations; polling on a
+    thread pool makes it the max of them instead.
+
+    Returns:
+        Dict mapping translation_id -> result element_id (None on failure)
+    """
+    if not translation_ids:
+        return {}
+
+    workers = min(max_workers if max_workers is not None else client.max_workers,
+                  len(translation_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            tid: executor.submit(poll_translation, client, tid, timeout)
+            for tid in translation_ids
+        }
+        return {tid: future.result() for tid, future in futures.items()}
+
+
 def execute_translation(
     client: OnshapeClient,
     ctx: DocContext,
@@ -577,18 +974,24 @@ def wait_for_microversion_change(
     client: OnshapeClient, 
     ctx: DocContext,
     eid: str, 
-    old_mv: Optional[str], 
-    timeout: int = 60
+    old_mv: Optional[str],
+    timeout: int = 60,
+    settle: float = 0.0
 ) -> Optional[str]:
-    """Poll until element microversion changes. Returns new mv or None."""
+    """Poll until element microversion changes. Returns new mv or None.
+
+    Args:
+        settle: Extra delay after the change is observed, for callers
+            whose element keeps rendering internally past the
+            microversion bump (drawings). Defaults to no delay.
+    """
     logging.info(f"Waiting for element {eid} to update...")
     
     def fetch() -> Optional[Dict[str, Any]]:
         try:
-            elements = list_elements(client, ctx)
-            return next((e for e in elements if e['id'] == eid), None)
+            return get_element(client, ctx, eid)
         except Exception as e:
-            logging.error(f"Failed to fetch elements: {e}")
+            logging.error(f"Failed to fetch element: {e}")
             return None
     
     def check_microversion(element: Optional[Dict[str, Any]]) -> Optional[str]:
@@ -604,8 +1007,8 @@ def wait_for_microversion_change(
     result = poll_until(fetch, check_microversion, timeout)
     if result is None or result == '__NOT_FOUND__':
         return None
-    # Small buffer for drawing app to finish internal rendering
-    time.sleep(2)
+    if settle > 0:
+        time.sleep(settle)
     return result
 
 
@@ -619,10 +1022,59 @@ def download_blob(client: OnshapeClient, ctx: DocContext, eid: str) -> Optional[
         return None
 
 
+def download_blob_to_file(
+    client: OnshapeClient,
+    ctx: DocContext,
+    eid: str,
+    out_path: Path,
+    chunk_size: int = 65536
+) -> bool:
+    """Stream a blob straight to disk in chunks.
+
+    Unlike download_blob, this never materializes the full payload in
+    memory, so peak memory stays O(chunk_size) even for multi-MB DXF/PDF
+    files.
+
+    Returns:
+        True on success, False on failure
+    """
+    endpoint = f"/blobelements{doc_path(ctx)}/e/{eid}"
+    logging.debug(f"Streaming blob {eid} to {out_path}")
+    try:
+        with client.session.stream('GET', endpoint) as response:
+            response.raise_for_status()
+            # Large userspace buffer lets the OS overlap network receive
+            # with writeback; sync once at the end, not per chunk
+            with open(out_path, 'wb', buffering=1 << 20) as f:
+                for chunk in response.iter_bytes(chunk_size):
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+        return True
+    except Exception as e:
+        logging.error(f"Failed to download blob {eid}: {e}")
+        return False
+
+
+def get_element(client: OnshapeClient, ctx: DocContext, eid: str) -> Optional[Dict[str, Any]]:
+    """Fetch a single element by id via server-side elementId filtering.
+
+    Deliberately uncached: the poll loops built on this need to observe
+    server-side changes, and the filtered response is one element
+    instead of the whole document's list.
+    """
+    endpoint = _ENDPOINT_ELEMENTS % doc_path(ctx)
+    resp = client.request('GET', endpoint, params={'elementId': eid})
+    elements = resp if isinstance(resp, list) else resp.get('elements', [])
+    for e in elements:
+        if e.get('id') == eid:
+            return e
+    return None
+
+
 def get_element_microversion(client: OnshapeClient, ctx: DocContext, eid: str) -> Optional[str]:
     """Get the current microversion ID of an element."""
-    elements = list_elements(client, ctx)
-    element = next((e for e in elements if e['id'] == eid), None)
+    element = get_element(client, ctx, eid)
     return element.get('microversionId') if element else None
 
 
@@ -2,8 +2,12 @@
 
 Reusable UI components for consistent interactive experience.
 """
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Sequence, TypeVar
 
 from .secrets import (
     load_secrets, save_secrets, prompt_secrets, get_or_prompt_secrets,
@@ -13,6 +17,27 @@ from .secrets import (
 
 # --- UI Primitives ---
 
+# Matches a bare non-negative integer; cheaper than int() + ValueError
+# for the common garbage-input case and compiled once at import
+_INT_RE = re.compile(r'^\s*(\d+)\s*$')
+
+
+def _read_int(prompt: str, lo: int, hi: int) -> int:
+    """Read an integer in [lo, hi] from stdin, reprompting until valid."""
+    range_error = f"Please enter 1-{hi} or 0 to cancel"
+    while True:
+        raw = input(prompt)
+        if not raw.strip():
+            continue
+        match = _INT_RE.match(raw)
+        if match is None:
+            print("Please enter a number")
+            continue
+        idx = int(match.group(1))
+        if lo <= idx <= hi:
+            return idx
+        print(range_error)
+
 def print_header(title: str, width: int = 60) -> None:
     """Print a centered header banner."""
     print("\n" + "=" * width)
@@ -26,31 +51,27 @@ def print_section(title: str, width: int = 40) -> None:
     print("-" * width)
 
 
-def interactive_select(items: List[Dict[str, Any]], prompt: str, 
-                       display_fn: Callable[[Dict[str, Any]], str]) -> Optional[Dict[str, Any]]:
+_T = TypeVar('_T')
+
+
+def interactive_select(items: Sequence[_T], prompt: str,
+                       display_fn: Callable[[_T], str]) -> Optional[_T]:
     """Numbered menu. Returns None on cancel or empty list."""
     if not items:
         print("No items available.")
         return None
     
-    print(f"\n{prompt}\n")
-    for i, item in enumerate(items, 1):
-        print(f"  {i}. {display_fn(item)}")
-    print("  0. Cancel\n")
-    
-    while True:
-        try:
-            choice = input("Enter number: ").strip()
-            if not choice:
-                continue
-            idx = int(choice)
-            if idx == 0:
-                return None
-            if 1 <= idx <= len(items):
-                return items[idx - 1]
-            print(f"Please enter 1-{len(items)} or 0 to cancel")
-        except ValueError:
-            print("Please enter a number")
+    # One write per frame instead of a print syscall per line
+    lines = [f"\n{prompt}\n"]
+    lines.extend(f"  {i}. {display_fn(item)}" for i, item in enumerate(items, 1))
+    lines.append("  0. Cancel\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+    idx = _read_int("Enter number: ", 0, len(items))
+    if idx == 0:
+        return None
+    return items[idx - 1]
 
 
 def interactive_menu(options: List[str], prompt: str = "Select option:") -> Optional[int]:
@@ -58,24 +79,16 @@ def interactive_menu(options: List[str], prompt: str = "Select option:") -> Opti
     
     Returns 0-indexed choice, or None on cancel (0 input).
     """
-    print(f"\n{prompt}\n")
-    for i, opt in enumerate(options, 1):
-        print(f"  {i}. {opt}")
-    print("  0. Cancel\n")
-    
-    while True:
-        try:
-            choice = input("Enter number: ").strip()
-            if not choice:
-                continue
-            idx = int(choice)
-            if idx == 0:
-                return None
-            if 1 <= idx <= len(options):
-                return idx - 1
-            print(f"Please enter 1-{len(options)} or 0 to cancel")
-        except ValueError:
-            print("Please enter a number")
+    lines = [f"\n{prompt}\n"]
+    lines.extend(f"  {i}. {opt}" for i, opt in enumerate(options, 1))
+    lines.append("  0. Cancel\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+    idx = _read_int("Enter number: ", 0, len(options))
+    if idx == 0:
+        return None
+    return idx - 1
 
 
 def interactive_toggles(options: Dict[str, bool], prompt: str = "Toggle options:") -> Dict[str, bool]:
@@ -88,25 +101,29 @@ def interactive_toggles(options: Dict[str, bool], prompt: str = "Toggle options:
     Returns:
         Updated dict with toggled values
     """
-    result = dict(options)
-    option_names = list(result.keys())
-    
+    # Parallel name/state sequences; avoids per-keystroke dict lookups
+    # and rebuilds the result dict only once on exit
+    option_names = tuple(options)
+    states = list(options.values())
+
     while True:
-        print(f"\n{prompt}\n")
-        for i, name in enumerate(option_names, 1):
-            status = "[X]" if result[name] else "[ ]"
-            print(f"  {i}. {status} {name}")
-        print("\n  Enter number to toggle, or press Enter to continue\n")
-        
+        lines = [f"\n{prompt}\n"]
+        lines.extend(
+            f"  {i}. {'[X]' if states[i - 1] else '[ ]'} {name}"
+            for i, name in enumerate(option_names, 1)
+        )
+        lines.append("\n  Enter number to toggle, or press Enter to continue\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
         choice = input("Enter: ").strip().lower()
         if choice == '':
-            return result
-        
+            return dict(zip(option_names, states))
+
         try:
             idx = int(choice)
             if 1 <= idx <= len(option_names):
-                key = option_names[idx - 1]
-                result[key] = not result[key]
+                states[idx - 1] ^= True
         except ValueError:
             print("Enter a number or press Enter to continue")
 
@@ -114,8 +131,7 @@ def interactive_toggles(options: Dict[str, bool], prompt: str = "Toggle options:
 # --- Setup Wizard ---
 
 def run_setup_wizard(secrets_path: Path, config_path: Path) -> None:
-    from .secrets import load_secrets, save_secrets, prompt_secrets
-    from .secrets import save_document_config, prompt_document_config
+    # Local import to avoid a circular dependency with cli
     from .cli import get_run_command
     
     print_header("ONSHAPE EXPORT TOOL - SETUP WIZARD")
@@ -142,14 +158,22 @@ def run_setup_wizard(secrets_path: Path, config_path: Path) -> None:
 
 # --- Interactive Export Flow ---
 
+@dataclass(frozen=True, slots=True)
+class ExportOption:
+    """A selectable workspace or version entry in the export menu."""
+    kind: str  # 'workspace' or 'version'
+    id: str
+    name: str
+    data: Dict[str, Any]
+
+
 def run_interactive_export(client: Any, output_dir: Path) -> Optional[Path]:
     """Full interactive export flow with document selection and options."""
     from .client import (
         list_documents, list_workspaces, list_versions,
         make_workspace_context, make_version_context
     )
-    from .workflow import run_export_workflow
-    
+
     print_header("INTERACTIVE EXPORT")
     
     # Step 1: Select document
@@ -175,16 +199,22 @@ def run_interactive_export(client: Any, output_dir: Path) -> Optional[Path]:
     # Step 2: Choose workspace or version
     print_section("Step 2: Select Workspace/Version")
     print("Fetching workspaces and versions...")
-    workspaces = list_workspaces(client, did)
-    versions = list_versions(client, did)
-    
-    # Build combined list
-    options: List[Dict[str, Any]] = []
-    for ws in workspaces:
-        options.append({'type': 'workspace', 'id': ws['id'], 'name': ws.get('name', 'Main'), 'data': ws})
-    for v in versions:
-        options.append({'type': 'version', 'id': v['id'], 'name': v.get('name', 'Unnamed'), 'data': v})
+    # Independent endpoints; overlap the two round trips
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ws_future = pool.submit(list_workspaces, client, did)
+        v_future = pool.submit(list_versions, client, did)
+        workspaces = ws_future.result()
+        versions = v_future.result()
     
+    # Build combined list in one allocation instead of two append loops
+    options: List[ExportOption] = [
+        ExportOption('workspace', ws['id'], ws.get('name', 'Main'), ws)
+        for ws in workspaces
+    ] + [
+        ExportOption('version', v['id'], v.get('name', 'Unnamed'), v)
+        for v in versions
+    ]
+
     if not options:
         print("No workspaces or versions found.")
         return None
@@ -192,14 +222,14 @@ def run_interactive_export(client: Any, output_dir: Path) -> Optional[Path]:
     choice = interactive_select(
         options,
         "Select workspace or version:",
-        lambda o: f"[{o['type'].upper()}] {o['name']}"
+        lambda o: f"[{o.kind.upper()}] {o.name}"
     )
     if not choice:
         print("Cancelled.")
         return None
-    
-    is_version = choice['type'] == 'version'
-    print(f"\n✓ Selected: [{choice['type'].upper()}] {choice['name']}")
+
+    is_version = choice.kind == 'version'
+    print(f"\n✓ Selected: [{choice.kind.upper()}] {choice.name}")
     
     # Step 3: Export Options (toggleable)
     print_section("Step 3: Export Options")
@@ -220,13 +250,16 @@ def run_interactive_export(client: Any, output_dir: Path) -> Optional[Path]:
     
     # Step 4: Create context and run
     print_section("Step 4: Running Export")
-    
+
+    # Deferred so cancelled flows never pay the workflow import
+    from .workflow import run_export_workflow
+
     if is_version:
-        ctx = make_version_context(did, choice['id'])
-        print(f"Exporting from version: {choice['name']}")
+        ctx = make_version_context(did, choice.id)
+        print(f"Exporting from version: {choice.name}")
     else:
-        ctx = make_workspace_context(did, choice['id'])
-        print(f"Exporting from workspace: {choice['name']}")
+        ctx = make_workspace_context(did, choice.id)
+        print(f"Exporting from workspace: {choice.name}")
     
     return run_export_workflow(client, ctx, output_dir,
                                clean_before=clean_before, clean_after=clean_after)
@@ -4,37 +4,98 @@ Contains the main export orchestration and all workflow steps.
 """
 import logging
 import re
+import tempfile
 import time
 import zipfile
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Callable, TypeVar, cast
+from typing import Dict, Any, List, Optional, Tuple, cast
 from typing_extensions import TypedDict
 
 from .client import (
-    OnshapeClient, DocContext, ExportResult,
+    OnshapeClient, DocContext, ExportResult, PartInfo,
     is_mutable, list_elements, get_features, list_parts, categorize_parts,
     get_part_thickness, get_part_properties, get_element_properties,
+    fetch_parts_info, thickness_from_bbox, properties_from_metadata,
     build_dxf_filename, build_pdf_filename,
     update_feature_suppression, delete_element, create_drawing,
     add_view_to_drawing, get_element_microversion, wait_for_microversion_change,
-    execute_translation, download_blob, get_drawing_references, PartProperties
+    execute_translation, initiate_translation, poll_translations, rename_element,
+    download_blob_to_file, get_drawing_references, PartProperties
 )
 
 
 # Prefixes for temporary elements that should be cleaned up
 TEMP_ELEMENT_PREFIXES = ("TEMP_", "DEBUG_VIEW_", "TEST_MV_")
 
-T = TypeVar('T')
+# Compiled once; matched against every feature of every Part Studio
+_ORIENT_FEATURE_RE = re.compile(r"^Orient Plates for Export(?: (\d+))?$")
 
+# Blob extensions produced by the export steps
+EXPORT_EXTENSIONS = ('.dxf', '.pdf')
 
-def pipeline(*steps: Callable[[T], T]) -> Callable[[T], T]:
-    """Compose left-to-right: pipeline(f, g, h)(x) = h(g(f(x)))"""
-    return lambda initial: reduce(lambda state, step: step(state), steps, initial)
+# Single-pass filename sanitization; also covers Windows-unsafe chars
+_SANITIZE_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
 
 
+def is_temp_name(name: str) -> bool:
+    """True if an element name carries one of the temp prefixes."""
+    # startswith with a tuple short-circuits in C; no regex needed
+    return name.startswith(TEMP_ELEMENT_PREFIXES)
+
+
+class ElementScan(TypedDict):
+    """Buckets produced by a single pass over the document's elements."""
+    temp: List[Dict[str, Any]]
+    export_blobs: List[Dict[str, Any]]
+    part_studios: List[Dict[str, Any]]
+    drawings: List[Dict[str, Any]]
+
+
+def scan_elements(elements: List[Dict[str, Any]]) -> ElementScan:
+    """Bucket elements for cleanup and discovery in one traversal.
+
+    The workflow needs temp-prefixed elements, DXF/PDF blobs, Part
+    Studios and drawings from the same list; classifying everything in
+    one pass avoids re-walking the list (and re-reading each element's
+    name) once per consumer.
+    """
+    temp: List[Dict[str, Any]] = []
+    export_blobs: List[Dict[str, Any]] = []
+    part_studios: List[Dict[str, Any]] = []
+    drawings: List[Dict[str, Any]] = []
+
+    for e in elements:
+        name = e.get('name', '')
+        is_temp = is_temp_name(name)
+        if is_temp:
+            temp.append(e)
+
+        element_type = e.get('elementType')
+        if element_type == 'BLOB':
+            if name.lower().endswith(EXPORT_EXTENSIONS):
+                export_blobs.append(e)
+        elif element_type == 'PARTSTUDIO':
+            part_studios.append(e)
+        elif element_type == 'DRAWING' or (
+            element_type == 'APPLICATION' and 'drawing' in e.get('dataType', '').lower()
+        ):
+            if not is_temp:
+                drawings.append(e)
+
+    return ElementScan(
+        temp=temp, export_blobs=export_blobs,
+        part_studios=part_studios, drawings=drawings
+    )
+
+# Cap on simultaneous per-part export pipelines (each holds a temp
+# drawing and an in-flight translation); kept low to respect Onshape's
+# backend throttling
+MAX_PARALLEL_EXPORTS = 4
+
 class WorkflowState(TypedDict, total=False):
-    """Immutable state for pipeline. Each step returns {**state, 'key': new}."""
+    """Shared workflow state, mutated in place by the step functions."""
     client: Any
     ctx: DocContext
     output_dir: Path
@@ -42,36 +103,51 @@ class WorkflowState(TypedDict, total=False):
     log_entries: List[str]
     part_studios: List[Dict[str, Any]]
     drawings: List[Dict[str, Any]]
+    scan: ElementScan
     zip_path: Optional[Path]
     collision_warnings: List[str]
 
 
 def log_step(state: WorkflowState, msg: str) -> WorkflowState:
-    entries = list(state.get('log_entries', []))
-    entries.append(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {msg}")
+    """Append a timestamped entry to the state's log (in place)."""
+    state.setdefault('log_entries', []).append(
+        f"{datetime.now().isoformat(sep=' ', timespec='seconds')} - {msg}"
+    )
     logging.info(msg)
-    return {**state, 'log_entries': entries}
+    return state
+
+
+def log_steps(state: WorkflowState, msgs: List[str]) -> WorkflowState:
+    """Append a batch of entries with one shared timestamp."""
+    if not msgs:
+        return state
+    stamp = datetime.now().isoformat(sep=' ', timespec='seconds')
+    state.setdefault('log_entries', []).extend(f"{stamp} - {msg}" for msg in msgs)
+    for msg in msgs:
+        logging.info(msg)
+    return state
 
 
 # --- Cleanup Functions ---
 
-def cleanup_temp_elements(client: OnshapeClient, ctx: DocContext) -> int:
+def cleanup_temp_elements(
+    client: OnshapeClient,
+    ctx: DocContext,
+    temp_elements: Optional[List[Dict[str, Any]]] = None
+) -> int:
     """Delete any leftover temporary elements from previous runs.
-    
+
+    Args:
+        temp_elements: Pre-scanned temp bucket (from scan_elements);
+            fetched and filtered here when not provided
+
     Returns:
         Number of elements deleted
     """
-    elements = list_elements(client, ctx)
-    temp_elements = [e for e in elements if e.get('name', '').startswith(TEMP_ELEMENT_PREFIXES)]
-    
-    deleted = 0
-    for e in temp_elements:
-        try:
-            delete_element(client, ctx, e['id'])
-            deleted += 1
-        except Exception as ex:
-            logging.debug(f"Failed to delete leftover {e['id']}: {ex}")
-    
+    if temp_elements is None:
+        temp_elements = scan_elements(list_elements(client, ctx))['temp']
+
+    deleted = _parallel_delete(client, ctx, temp_elements)
     if deleted > 0:
         logging.info(f"Cleaned up {deleted} temporary elements")
     return deleted
@@ -91,45 +167,70 @@ def find_blobs_by_extension(
         List of matching blob element dicts
     """
     elements = list_elements(client, ctx)
-    blobs = []
-    for e in elements:
-        if e.get('elementType') == 'BLOB':
-            name = e.get('name', '').lower()
-            if any(name.endswith(ext) for ext in extensions):
-                blobs.append(e)
-    return blobs
+    # str.endswith takes the tuple directly and checks all suffixes in C
+    return [
+        e for e in elements
+        if e.get('elementType') == 'BLOB'
+        and e.get('name', '').lower().endswith(extensions)
+    ]
 
 
-def delete_elements(
-    client: OnshapeClient, 
-    ctx: DocContext, 
+def _parallel_delete(
+    client: OnshapeClient,
+    ctx: DocContext,
     elements: List[Dict[str, Any]]
 ) -> int:
-    """Delete multiple elements. Returns count successfully deleted."""
+    """Delete elements concurrently; each is an independent HTTPS DELETE.
+
+    Returns:
+        Count successfully deleted
+    """
+    if not elements:
+        return 0
+
     deleted = 0
-    for e in elements:
-        try:
-            delete_element(client, ctx, e['id'])
-            deleted += 1
-        except Exception as ex:
-            logging.debug(f"Failed to delete {e['id']}: {ex}")
+    with ThreadPoolExecutor(max_workers=min(client.max_workers, len(elements))) as executor:
+        futures = {executor.submit(delete_element, client, ctx, e['id']): e for e in elements}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                deleted += 1
+            except Exception as ex:
+                logging.debug(f"Failed to delete {futures[future]['id']}: {ex}")
     return deleted
 
 
-def cleanup_exports(client: OnshapeClient, ctx: DocContext) -> int:
+def delete_elements(
+    client: OnshapeClient,
+    ctx: DocContext,
+    elements: List[Dict[str, Any]]
+) -> int:
+    """Delete multiple elements. Returns count successfully deleted."""
+    return _parallel_delete(client, ctx, elements)
+
+
+def cleanup_exports(
+    client: OnshapeClient,
+    ctx: DocContext,
+    blobs: Optional[List[Dict[str, Any]]] = None
+) -> int:
     """Delete all DXF and PDF blobs from document.
-    
+
     Composable cleanup operation for --clean flag.
     Only works on mutable contexts (workspaces).
-    
+
+    Args:
+        blobs: Pre-scanned export_blobs bucket (from scan_elements)
+
     Returns:
         Number of elements deleted
     """
     if not is_mutable(ctx):
         logging.warning("Cannot cleanup exports in immutable context (version/microversion)")
         return 0
-    
-    blobs = find_blobs_by_extension(client, ctx, ('.dxf', '.pdf'))
+
+    if blobs is None:
+        blobs = find_blobs_by_extension(client, ctx, EXPORT_EXTENSIONS)
     if not blobs:
         logging.info("No DXF/PDF blobs to clean up")
         return 0
@@ -151,18 +252,9 @@ def discover_exportables(
     Returns:
         Tuple of (part_studios, drawings) where each is a list of element dicts
     """
-    elements = list_elements(client, ctx)
-    
-    part_studios = [e for e in elements if e['elementType'] == 'PARTSTUDIO']
-    drawings = [
-        e for e in elements 
-        if e['elementType'] == 'DRAWING' or 
-        (e['elementType'] == 'APPLICATION' and 'drawing' in e.get('dataType', '').lower())
-    ]
-    
-    # Filter out temp drawings
-    drawings = [d for d in drawings if not d['name'].startswith(TEMP_ELEMENT_PREFIXES)]
-    
+    scan = scan_elements(list_elements(client, ctx))
+    part_studios, drawings = scan['part_studios'], scan['drawings']
+
     logging.info(f"Discovered {len(part_studios)} Part Studios and {len(drawings)} drawings")
     return part_studios, drawings
 
@@ -173,20 +265,17 @@ def find_orient_feature(features: List[Dict[str, Any]]) -> Optional[Dict[str, An
     Returns:
         The feature dict, or None if not found
     """
-    pattern = re.compile(r"^Orient Plates for Export(?: (\d+))?$")
-    candidates = []
-    
+    best_index = -1
+    best: Optional[Dict[str, Any]] = None
+
     for f in features:
-        match = pattern.match(f.get('name', ''))
+        match = _ORIENT_FEATURE_RE.match(f.get('name', ''))
         if match:
             index = int(match.group(1)) if match.group(1) else 0
-            candidates.append((index, f))
-    
-    if not candidates:
-        return None
-    
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    return candidates[0][1]
+            if index > best_index:
+                best_index, best = index, f
+
+    return best
 
 
 # --- Export Functions ---
@@ -195,13 +284,18 @@ def export_part_as_dxf(
     client: OnshapeClient,
     ctx: DocContext,
     part_studio_eid: str,
-    part: Dict[str, Any]
+    part: Dict[str, Any],
+    part_info: Optional[PartInfo] = None
 ) -> Optional[ExportResult]:
     """Export a single part as DXF via temporary drawing.
-    
+
     Creates a temp drawing, adds a top view, exports to DXF, then cleans up.
     Prepends part thickness to filename if available.
-    
+
+    Args:
+        part_info: Prefetched metadata/bounding box (from fetch_parts_info);
+            avoids two extra round-trips per part when provided
+
     Returns:
         (result_element_id, filename) tuple on success, None on failure
     """
@@ -219,28 +313,41 @@ def export_part_as_dxf(
     logging.info(f"Created temp drawing for '{part_name}'")
     
     try:
-        # Add view and wait for it to render
+        # Add view and wait for it to render; the settle delay covers
+        # the drawing app's internal rendering past the microversion bump
         add_view_to_drawing(client, ctx, temp_drawing_id, part_studio_eid, part_id)
-        new_mv = wait_for_microversion_change(client, ctx, temp_drawing_id, old_mv)
+        new_mv = wait_for_microversion_change(client, ctx, temp_drawing_id, old_mv, settle=2.0)
         if new_mv is None:
             logging.error(f"Timed out waiting for view to render for '{part_name}'")
             return None
         
+        # Fallback when no prefetched info was supplied: fetch both
+        # part lookups concurrently rather than serially
+        if part_info is None and part_id:
+            part_info = fetch_parts_info(client, ctx, part_studio_eid, [part_id]).get(part_id)
+
         # Get part thickness from bounding box Z-height
-        thickness = get_part_thickness(client, ctx, part_studio_eid, part_id)
+        if part_info is not None and 'bounding_box' in part_info:
+            thickness = thickness_from_bbox(part_info['bounding_box'])
+        else:
+            thickness = get_part_thickness(client, ctx, part_studio_eid, part_id)
         if thickness:
             logging.debug(f"Part '{part_name}' thickness: {thickness:.2f}mm")
-        
+
         # Get part properties for filename
-        props, missing = get_part_properties(client, ctx, part_studio_eid, part_id)
+        if part_info is not None and 'metadata' in part_info:
+            props, missing = properties_from_metadata(part_info['metadata'])
+        else:
+            props, missing = get_part_properties(client, ctx, part_studio_eid, part_id)
         if missing:
             logging.warning(f"Part '{part_name}' missing properties: {', '.join(missing)}")
         
         # Build filename from properties
         filename = build_dxf_filename(part_name, thickness, props)
         
-        # Export to DXF using unified translation
-        result = execute_translation(client, ctx, temp_drawing_id, 'DXF', part_name, filename)
+        # Export to DXF using unified translation (slot-bounded)
+        with client.export_slot():
+            result = execute_translation(client, ctx, temp_drawing_id, 'DXF', part_name, filename)
         if result is None:
             return None
         
@@ -255,6 +362,45 @@ def export_part_as_dxf(
             logging.warning(f"Failed to delete temp drawing: {e}")
 
 
+def export_parts_concurrently(
+    client: OnshapeClient,
+    ctx: DocContext,
+    eid: str,
+    parts: List[Dict[str, Any]],
+    parts_info: Dict[str, PartInfo],
+    max_workers: int = MAX_PARALLEL_EXPORTS
+) -> List[ExportResult]:
+    """Run the per-part temp-drawing DXF pipeline for several parts at once.
+
+    Each part's create -> add view -> translate -> poll chain is internally
+    sequential, but the chains are independent across parts, so K parts
+    take ~ceil(K/workers) pipeline durations instead of K.
+
+    Returns:
+        List of (result_eid, filename) tuples for successful exports
+    """
+    if not parts:
+        return []
+
+    results: List[ExportResult] = []
+
+    def job(part: Dict[str, Any]) -> Optional[ExportResult]:
+        return export_part_as_dxf(client, ctx, eid, part, parts_info.get(part.get('partId', '')))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(parts))) as executor:
+        futures = [(executor.submit(job, p), p) for p in parts]
+        for future, part in futures:
+            part_name = part.get('name', 'unnamed_part')
+            try:
+                result = future.result()
+                if result:
+                    results.append(result)
+            except Exception as e:
+                logging.error(f"Failed to export part '{part_name}': {e}")
+
+    return results
+
+
 def export_part_studio(
     client: OnshapeClient,
     ctx: DocContext,
@@ -281,16 +427,11 @@ def export_part_studio(
     
     logging.info(f"Found {len(flat_patterns)} flat patterns, {len(regular_parts)} regular parts")
     
+    # Prefetch metadata/bounding boxes for all flat patterns concurrently
+    flat_info = fetch_parts_info(client, ctx, eid, [f['partId'] for f in flat_patterns if f.get('partId')])
+
     # Export flat patterns directly (they're already correctly oriented)
-    for flat in flat_patterns:
-        flat_name = flat.get('name', 'unnamed_flat')
-        try:
-            result = export_part_as_dxf(client, ctx, eid, flat)
-            if result:
-                results.append(result)
-                logging.info(f"Exported flat pattern '{flat_name}'")
-        except Exception as e:
-            logging.error(f"Failed to export flat pattern '{flat_name}': {e}")
+    results.extend(export_parts_concurrently(client, ctx, eid, flat_patterns, flat_info))
     
     # Phase 2: Export regular parts using orient feature (if any exist)
     if not regular_parts:
@@ -306,22 +447,24 @@ def export_part_studio(
     
     # Unsuppress feature
     logging.info(f"Unsuppressing '{orient_feature.get('name')}'")
+    old_mv = get_element_microversion(client, ctx, eid)
     update_feature_suppression(client, ctx, eid, orient_feature, False)
-    
+
     try:
-        time.sleep(5)  # Allow Part Studio to regenerate
+        # Poll for the regeneration instead of a fixed sleep; returns as
+        # soon as the Part Studio's microversion moves (usually well
+        # under the old 5s delay)
+        if wait_for_microversion_change(client, ctx, eid, old_mv, timeout=15) is None:
+            logging.warning(f"No microversion change after unsuppress in {name}; proceeding after grace delay")
+            time.sleep(1)
         # Re-fetch parts after orient feature is unsuppressed
         oriented_parts = list_parts(client, ctx, eid)
-        
-        for part in oriented_parts:
-            part_name = part.get('name', 'unnamed_part')
-            try:
-                result = export_part_as_dxf(client, ctx, eid, part)
-                if result:
-                    results.append(result)
-            except Exception as e:
-                logging.error(f"Failed to export part '{part_name}': {e}")
-                
+
+        # Prefetch metadata/bounding boxes for all oriented parts concurrently
+        oriented_info = fetch_parts_info(client, ctx, eid, [p['partId'] for p in oriented_parts if p.get('partId')])
+
+        results.extend(export_parts_concurrently(client, ctx, eid, oriented_parts, oriented_info))
+
     finally:
         # Always re-suppress feature
         update_feature_suppression(client, ctx, eid, orient_feature, True)
@@ -330,52 +473,108 @@ def export_part_studio(
     return results
 
 
-def export_drawing_as_pdf(
+def prepare_drawing_filename(
     client: OnshapeClient,
     ctx: DocContext,
     drawing: Dict[str, Any]
-) -> Optional[ExportResult]:
-    """Export an existing drawing as PDF.
-    
-    Returns:
-        (result_eid, filename) tuple on success, None on failure
-    """
+) -> str:
+    """Resolve referenced-element properties and build the PDF filename."""
     name = drawing['name']
     eid = drawing['id']
-    
-    logging.info(f"Processing drawing: {name}")
-    
+
     # Get properties from the element referenced by this drawing
     props: PartProperties = {}
     missing: List[str] = ['Part Number', 'Revision']
-    
+
     # Query drawing for referenced Part Studios/Assemblies
     refs = get_drawing_references(client, ctx, eid)
-    
+
     if refs:
         ref = refs[0]
         target_eid = ref.get('targetElementId')
-        
+
         if target_eid:
             props, missing = get_element_properties(client, ctx, target_eid)
             if props:
                 logging.debug(f"Drawing '{name}' got properties from element {target_eid}")
-    
+
     if missing:
         logging.warning(f"Drawing '{name}' missing properties: {', '.join(missing)}")
-    
-    # Build filename from properties
-    filename = build_pdf_filename(name, props)
-    
-    # Export to PDF using unified translation
-    result = execute_translation(client, ctx, eid, 'PDF', name, filename)
+
+    return build_pdf_filename(name, props)
+
+
+def export_drawing_as_pdf(
+    client: OnshapeClient,
+    ctx: DocContext,
+    drawing: Dict[str, Any]
+) -> Optional[ExportResult]:
+    """Export an existing drawing as PDF.
+
+    Returns:
+        (result_eid, filename) tuple on success, None on failure
+    """
+    name = drawing['name']
+    eid = drawing['id']
+
+    logging.info(f"Processing drawing: {name}")
+
+    filename = prepare_drawing_filename(client, ctx, drawing)
+
+    # Export to PDF using unified translation (slot-bounded)
+    with client.export_slot():
+        result = execute_translation(client, ctx, eid, 'PDF', name, filename)
     if result is None:
         return None
-    
+
     logging.info(f"Exported '{name}' → {result[0]} ({filename})")
     return result
 
 
+def export_drawings_as_pdfs(
+    client: OnshapeClient,
+    ctx: DocContext,
+    drawings: List[Dict[str, Any]]
+) -> List[ExportResult]:
+    """Export drawings as PDFs, polling all translations concurrently.
+
+    Onshape runs translation jobs in parallel server-side, so every
+    translation is initiated up front and the polls overlap; total wait
+    is the slowest job rather than the sum of all of them.
+
+    Returns:
+        List of (result_eid, filename) tuples for successful exports
+    """
+    pending: List[Tuple[str, str]] = []  # (translation_id, filename)
+
+    for drawing in drawings:
+        name = drawing['name']
+        logging.info(f"Processing drawing: {name}")
+        filename = prepare_drawing_filename(client, ctx, drawing)
+        try:
+            trans_id = initiate_translation(client, ctx, drawing['id'], 'PDF', name)
+        except Exception as e:
+            logging.error(f"Failed to initiate PDF translation for '{name}': {e}")
+            continue
+        if not trans_id:
+            logging.error(f"Failed to initiate PDF translation for '{name}'")
+            continue
+        pending.append((trans_id, filename))
+
+    resolved = poll_translations(client, [tid for tid, _ in pending])
+
+    results: List[ExportResult] = []
+    for trans_id, filename in pending:
+        result_id = resolved.get(trans_id)
+        if result_id is None:
+            logging.error(f"PDF translation failed ({filename})")
+            continue
+        rename_element(client, ctx, result_id, filename)
+        results.append((result_id, filename))
+        logging.info(f"Exported → {result_id} ({filename})")
+    return results
+
+
 def package_results(
     client: OnshapeClient,
     ctx: DocContext,
@@ -383,45 +582,78 @@ def package_results(
     output_dir: Path,
     log_entries: List[str]
 ) -> Tuple[Optional[Path], List[str]]:
-    """Download exported files and package them into a ZIP.
-    
+    """Download exported files concurrently and package them into a ZIP.
+
     Detects filename collisions and skips duplicates, collecting warnings.
-    
+    Collision detection runs as a pure pass before any download, so the
+    warnings are deterministic; downloads then overlap on a thread pool
+    and the (non-thread-safe) ZipFile is only written from this thread.
+
     Returns:
         Tuple of (path to ZIP file or None, list of collision warnings)
     """
     if not results:
         logging.info("No files to package")
         return None, []
-    
+
     logging.info(f"Downloading {len(results)} files...")
-    
+
     zip_name = f"onshape_export_{int(time.time())}.zip"
     zip_path = output_dir / zip_name
-    
+
+    # Pass 1: dedupe by sanitized filename (no I/O)
     seen_filenames: Dict[str, str] = {}  # filename -> first element_id
     collision_warnings: List[str] = []
-    
-    with zipfile.ZipFile(zip_path, 'w') as zf:
-        for result_id, filename in results:
-            safe_name = filename.replace(' ', '_').replace('/', '_')
-            
-            # Check for filename collision
-            if safe_name in seen_filenames:
-                first_id = seen_filenames[safe_name]
-                warning = f"Filename collision: '{safe_name}' - kept element {first_id}, skipped element {result_id}"
-                collision_warnings.append(warning)
-                logging.warning(warning)
-                continue
-            
-            seen_filenames[safe_name] = result_id
-            
-            content = download_blob(client, ctx, result_id)
-            if content is None:
-                logging.error(f"Failed to download {result_id}, skipping")
-                continue
-            zf.writestr(safe_name, content)
-        
+    unique: List[Tuple[str, str]] = []  # (element_id, safe_name)
+
+    for result_id, filename in results:
+        safe_name = filename.translate(_SANITIZE_TABLE)
+        if safe_name in seen_filenames:
+            first_id = seen_filenames[safe_name]
+            warning = f"Filename collision: '{safe_name}' - kept element {first_id}, skipped element {result_id}"
+            collision_warnings.append(warning)
+            logging.warning(warning)
+            continue
+        seen_filenames[safe_name] = result_id
+        unique.append((result_id, safe_name))
+
+    # Pass 2: stream downloads to temp files in parallel, then copy into
+    # the archive serially as futures complete. Streaming keeps peak
+    # memory at one chunk per in-flight download instead of the sum of
+    # all blob sizes.
+    def fetch(result_id: str, tmp_path: Path) -> bool:
+        with client.export_slot():
+            return download_blob_to_file(client, ctx, result_id, tmp_path)
+
+    # Level-1 deflate gets most of the ~5-10x win on ASCII DXFs for a
+    # fraction of the CPU; PDFs are internally compressed already and
+    # are stored as-is below
+    with tempfile.TemporaryDirectory(dir=output_dir) as tmp_dir, \
+         zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=1, allowZip64=True) as zf:
+        tmp_root = Path(tmp_dir)
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_EXPORTS, len(unique))) as executor:
+            futures = {
+                executor.submit(fetch, result_id, tmp_root / safe_name): (result_id, safe_name)
+                for result_id, safe_name in unique
+            }
+            for future in as_completed(futures):
+                result_id, safe_name = futures[future]
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to download {result_id}: {e}")
+                    continue
+                if not ok:
+                    logging.error(f"Failed to download {result_id}, skipping")
+                    continue
+                tmp_path = tmp_root / safe_name
+                if safe_name.lower().endswith('.pdf'):
+                    zf.write(tmp_path, arcname=safe_name, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(tmp_path, arcname=safe_name)
+                tmp_path.unlink()  # Cap transient disk usage
+
         # Include log
         zf.writestr("export_operation.log", "\n".join(log_entries))
     
@@ -461,46 +693,49 @@ def run_export_workflow(
     def step_init(state: WorkflowState) -> WorkflowState:
         """Initialize workflow state."""
         return log_step(state, "Starting export workflow")
-    
+
+    def step_scan(state: WorkflowState) -> WorkflowState:
+        """Fetch and bucket the element list once for the steps below."""
+        state['scan'] = scan_elements(list_elements(state['client'], state['ctx']))
+        return state
+
     def step_pre_clean(state: WorkflowState) -> WorkflowState:
         """Pre-clean: delete existing exports if requested."""
         if clean_before and is_mutable(state['ctx']):
-            deleted = cleanup_exports(state['client'], state['ctx'])
+            deleted = cleanup_exports(state['client'], state['ctx'], state['scan']['export_blobs'])
             if deleted > 0:
                 return log_step(state, f"Pre-cleaned {deleted} existing exports")
         return state
-    
+
     def step_cleanup_temp(state: WorkflowState) -> WorkflowState:
         """Cleanup leftover temp elements."""
-        cleanup_temp_elements(state['client'], state['ctx'])
+        cleanup_temp_elements(state['client'], state['ctx'], state['scan']['temp'])
         return state
-    
+
     def step_discover(state: WorkflowState) -> WorkflowState:
-        """Discover Part Studios and Drawings."""
-        part_studios, drawings = discover_exportables(state['client'], state['ctx'])
-        state = {**state, 'part_studios': part_studios, 'drawings': drawings}
+        """Discover Part Studios and Drawings (from the upfront scan)."""
+        scan = state['scan']
+        part_studios, drawings = scan['part_studios'], scan['drawings']
+        state['part_studios'] = part_studios
+        state['drawings'] = drawings
         return log_step(state, f"Found {len(part_studios)} Part Studios, {len(drawings)} drawings")
     
     def step_export_dxfs(state: WorkflowState) -> WorkflowState:
         """Export parts from Part Studios as DXFs."""
-        results = list(state.get('results', []))
+        results = state.setdefault('results', [])
         for ps in state.get('part_studios', []):
             ps_results = export_part_studio(state['client'], state['ctx'], ps)
             results.extend(ps_results)
-            for _, filename in ps_results:
-                state = log_step(state, f"Exported: {filename}")
-        return {**state, 'results': results}
-    
+            log_steps(state, [f"Exported: {filename}" for _, filename in ps_results])
+        return state
+
     def step_export_pdfs(state: WorkflowState) -> WorkflowState:
-        """Export Drawings as PDFs."""
-        results = list(state.get('results', []))
-        for dr in state.get('drawings', []):
-            result = export_drawing_as_pdf(state['client'], state['ctx'], dr)
-            if result:
-                results.append(result)
-                state = log_step(state, f"Exported: {result[1]}")
-        return {**state, 'results': results}
-    
+        """Export Drawings as PDFs (translations polled concurrently)."""
+        pdf_results = export_drawings_as_pdfs(state['client'], state['ctx'], state.get('drawings', []))
+        state.setdefault('results', []).extend(pdf_results)
+        log_steps(state, [f"Exported: {filename}" for _, filename in pdf_results])
+        return state
+
     def step_package(state: WorkflowState) -> WorkflowState:
         """Package results into ZIP."""
         results = state.get('results', [])
@@ -508,7 +743,8 @@ def run_export_workflow(
         zip_path, collision_warnings = package_results(
             state['client'], state['ctx'], results, state['output_dir'], log_entries
         )
-        state = {**state, 'zip_path': zip_path, 'collision_warnings': collision_warnings}
+        state['zip_path'] = zip_path
+        state['collision_warnings'] = collision_warnings
         if zip_path:
             return log_step(state, f"SUCCESS: {zip_path}")
         else:
@@ -536,19 +772,28 @@ def run_export_workflow(
     }
     
     try:
-        # Compose and execute pipeline
-        workflow = pipeline(
+        # Straight-line step sequence; each step mutates state in place
+        state = initial_state
+        for step in (
             step_init,
+            step_scan,
             step_pre_clean,
             step_cleanup_temp,
             step_discover,
-            step_export_dxfs,
-            step_export_pdfs,
-            step_package,
-            step_post_clean
-        )
-        
-        final_state = workflow(initial_state)
+        ):
+            state = step(state)
+
+        # Skip the export steps outright when discovery found nothing;
+        # packaging still runs so the empty-result path logs uniformly
+        if state['part_studios'] or state['drawings']:
+            state = step_export_pdfs(step_export_dxfs(state))
+        else:
+            state = log_step(state, "Nothing to export; skipping export steps")
+
+        for step in (step_package, step_post_clean):
+            state = step(state)
+
+        final_state = state
         zip_path = final_state.get('zip_path')
         
         if zip_path:
@@ -5,7 +5,9 @@ from unittest.mock import Mock
 @pytest.fixture
 def mock_client():
     """Create a mock OnshapeClient."""
-    return Mock()
+    client = Mock()
+    client.max_workers = 8  # Real value; pool sizing does arithmetic on it
+    return client
 
 
 @pytest.fixture
@@ -11,25 +11,26 @@ from onshape.client import (
     get_features,
     list_parts,
     delete_element,
+    fetch_parts_info,
 )
 from onshape.workflow import cleanup_exports
 
 
 class TestListElements:
     def test_returns_list_on_list_response(self, mock_client, sample_ctx):
-        mock_client.request.return_value = [
+        mock_client.cached_get.return_value = [
             {'id': '1', 'name': 'PS1', 'elementType': 'PARTSTUDIO'},
             {'id': '2', 'name': 'Drawing', 'elementType': 'DRAWING'},
         ]
-        
+
         result = list_elements(mock_client, sample_ctx)
         assert len(result) == 2
         assert result[0]['name'] == 'PS1'
-    
+
     def test_extracts_elements_from_dict(self, mock_client, sample_ctx):
         """API sometimes wraps response in {'elements': [...]}."""
-        mock_client.request.return_value = {'elements': [{'id': '1', 'name': 'PS1'}]}
-        
+        mock_client.cached_get.return_value = {'elements': [{'id': '1', 'name': 'PS1'}]}
+
         result = list_elements(mock_client, sample_ctx)
         assert len(result) == 1
 
@@ -74,6 +75,44 @@ class TestDeleteElement:
         assert 'elem123' in call_args[0][1]
 
 
+class TestFetchPartsInfo:
+    def test_collects_metadata_and_bbox_per_part(self, mock_client, sample_ctx):
+        def fake_get(ctx, endpoint, mv=None):
+            if '/metadata' in endpoint:
+                return {'properties': []}
+            return {'lowZ': 0.0, 'highZ': 0.003}
+        mock_client.cached_get.side_effect = fake_get
+
+        info = fetch_parts_info(mock_client, sample_ctx, 'eid123', ['p1', 'p2'], max_workers=2)
+
+        assert set(info.keys()) == {'p1', 'p2'}
+        assert info['p1']['metadata'] == {'properties': []}
+        assert info['p2']['bounding_box']['highZ'] == 0.003
+
+    def test_bulk_metadata_covers_all_parts(self, mock_client, sample_ctx):
+        """One element-level metadata call serves every part; no per-part fetches."""
+        def fake_get(ctx, endpoint, mv=None):
+            if endpoint.endswith('/p'):
+                return {'items': [
+                    {'partId': 'p1', 'properties': [{'name': 'Part number', 'value': 'PN-1'}]},
+                    {'partId': 'p2', 'properties': []},
+                ]}
+            if '/boundingboxes' in endpoint:
+                return {'lowZ': 0.0, 'highZ': 0.003}
+            raise AssertionError(f"unexpected per-part fetch: {endpoint}")
+        mock_client.cached_get.side_effect = fake_get
+
+        info = fetch_parts_info(mock_client, sample_ctx, 'eid123', ['p1', 'p2'], max_workers=2)
+
+        assert info['p1']['metadata']['partId'] == 'p1'
+        assert info['p2']['metadata'] == {'partId': 'p2', 'properties': []}
+        assert info['p1']['bounding_box']['highZ'] == 0.003
+
+    def test_empty_part_ids_makes_no_requests(self, mock_client, sample_ctx):
+        assert fetch_parts_info(mock_client, sample_ctx, 'eid123', []) == {}
+        mock_client.cached_get.assert_not_called()
+
+
 class TestCleanupExports:
     def test_skips_immutable_context(self, mock_client, version_ctx):
         """Cannot delete from versions/microversions."""
@@ -83,15 +122,13 @@ class TestCleanupExports:
     
     def test_finds_and_deletes_blobs(self, mock_client, sample_ctx):
         """Finds DXF/PDF blobs by extension and deletes them."""
-        mock_client.request.side_effect = [
-            [
-                {'id': '1', 'name': 'export.dxf', 'elementType': 'BLOB'},
-                {'id': '2', 'name': 'drawing.pdf', 'elementType': 'BLOB'},
-                {'id': '3', 'name': 'Part Studio', 'elementType': 'PARTSTUDIO'},
-            ],
-            None, None,  # delete responses
+        mock_client.cached_get.return_value = [
+            {'id': '1', 'name': 'export.dxf', 'elementType': 'BLOB'},
+            {'id': '2', 'name': 'drawing.pdf', 'elementType': 'BLOB'},
+            {'id': '3', 'name': 'Part Studio', 'elementType': 'PARTSTUDIO'},
         ]
-        
+        mock_client.request.side_effect = [None, None]  # delete responses
+
         result = cleanup_exports(mock_client, sample_ctx)
         assert result == 2
-        assert mock_client.request.call_count == 3  # 1 GET + 2 DELETE
+        assert mock_client.request.call_count == 2  # 2 DELETE
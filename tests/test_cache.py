@@ -0,0 +1,45 @@
+"""Persistent cache tests. Uses a temp sqlite file, no mocking needed."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from onshape.cache import PersistentCache, cache_key
+
+
+class TestCacheKey:
+    def test_stable_for_same_inputs(self):
+        assert cache_key('a', 'b') == cache_key('a', 'b')
+
+    def test_differs_for_different_inputs(self):
+        assert cache_key('a', 'b') != cache_key('a', 'c')
+
+
+class TestPersistentCache:
+    def test_round_trip(self, tmp_path):
+        cache = PersistentCache(tmp_path / "cache.db")
+        cache.put('k1', {'elements': [1, 2, 3]})
+        assert cache.get('k1') == {'elements': [1, 2, 3]}
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = PersistentCache(tmp_path / "cache.db")
+        assert cache.get('missing') is None
+
+    def test_survives_reopen(self, tmp_path):
+        path = tmp_path / "cache.db"
+        cache = PersistentCache(path)
+        cache.put('k1', [1, 2])
+        cache.close()
+
+        reopened = PersistentCache(path)
+        assert reopened.get('k1') == [1, 2]
+
+    def test_expired_entry_evicted(self, tmp_path):
+        cache = PersistentCache(tmp_path / "cache.db")
+        cache.put('k1', 'value', ttl=-1)  # Already expired
+        assert cache.get('k1') is None
+
+    def test_non_serializable_value_skipped(self, tmp_path):
+        cache = PersistentCache(tmp_path / "cache.db")
+        cache.put('k1', object())
+        assert cache.get('k1') is None
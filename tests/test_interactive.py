@@ -136,7 +136,7 @@ class TestGetOrPromptSecrets:
         import json
         with open(secrets_file) as f:
             data = json.load(f)
-        assert data.get('version') == 1
+        assert data.get('version') == 2
         assert 'salt' in data
         assert 'data' in data
 
@@ -154,6 +154,27 @@ class TestEncryption:
         assert decrypted['access_key'] == original['access_key']
         assert decrypted['secret_key'] == original['secret_key']
     
+    def test_decrypts_legacy_v1_format(self):
+        """Files written before the scrypt switch (v1 = PBKDF2) still decrypt."""
+        import base64
+        import os
+        from cryptography.fernet import Fernet
+        from onshape.secrets import derive_key
+
+        password = "legacy"
+        salt = os.urandom(16)
+        key = derive_key(password, salt, version=1)
+        token = Fernet(key).encrypt(b'{"accessKey": "a", "secretKey": "s"}')
+        storage = {
+            'version': 1,
+            'salt': base64.b64encode(salt).decode(),
+            'data': token.decode(),
+        }
+
+        result = decrypt_secrets(storage, password)
+        assert result['access_key'] == 'a'
+        assert result['secret_key'] == 's'
+
     def test_wrong_password_fails(self):
         from cryptography.fernet import InvalidToken
         
@@ -6,14 +6,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from onshape.client import (
-    categorize_parts, 
+    categorize_parts,
     format_thickness_prefix,
     doc_path,
     is_mutable,
     make_workspace_context,
     make_version_context,
+    extract_properties_from_list,
+    PROP_PART_NUMBER,
+    PROP_REVISION,
+    PROP_MATERIAL,
 )
-from onshape.workflow import find_orient_feature, pipeline
+from onshape.workflow import find_orient_feature
 
 
 class TestCategorizeParts:
@@ -80,6 +84,29 @@ class TestFormatThicknessPrefix:
         assert format_thickness_prefix(value) == expected
 
 
+class TestExtractPropertiesFromList:
+    def test_extracts_all_properties(self):
+        properties = [
+            {'propertyId': PROP_PART_NUMBER, 'value': 'PN-001'},
+            {'propertyId': PROP_REVISION, 'value': 'B'},
+            {'propertyId': PROP_MATERIAL, 'value': {'displayName': 'Steel'}},
+            {'propertyId': 'unrelated', 'value': 'ignored'},
+        ]
+        props, missing = extract_properties_from_list(properties)
+        assert props == {'part_number': 'PN-001', 'revision': 'B', 'material': 'Steel'}
+        assert missing == []
+
+    def test_reports_missing_properties(self):
+        props, missing = extract_properties_from_list([])
+        assert props == {}
+        assert missing == ['Part Number', 'Revision', 'Material']
+
+    def test_material_skipped_for_elements(self):
+        """Element metadata has no material property (include_material=False)."""
+        props, missing = extract_properties_from_list([], include_material=False)
+        assert missing == ['Part Number', 'Revision']
+
+
 class TestDocPath:
     def test_workspace_path(self):
         ctx = {'did': 'doc123', 'wvm_type': 'w', 'wvm_id': 'ws456'}
@@ -123,16 +150,3 @@ class TestMakeVersionContext:
     def test_version_context_is_not_mutable(self):
         ctx = make_version_context('doc', 'ver')
         assert is_mutable(ctx) is False
-
-
-class TestPipeline:
-    def test_composes_left_to_right(self):
-        add_one = lambda x: x + 1
-        double = lambda x: x * 2
-        assert pipeline(add_one, double)(1) == 4  # (1+1)*2
-    
-    def test_single_function(self):
-        assert pipeline(lambda x: x + 1)(5) == 6
-    
-    def test_empty_pipeline(self):
-        assert pipeline()(42) == 42